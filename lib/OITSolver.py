@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+from array import array
+from typing import Dict, List, Optional, Tuple
+import time
+
+
+class OITSolver:
+    """
+    Native 1-in-3-SAT solver working directly on the flat literal array produced by OITStreamReader.
+
+    Every clause is an exactly-one constraint: as soon as one of its literals becomes TRUE the other
+    two are forced FALSE, and once two of its literals are FALSE the remaining one is forced TRUE.
+    These rules are applied through occurrence lists (unit propagation), and a DPLL search with
+    chronological backtracking branches on the variables that are left.
+    """
+
+    def __init__(self, literals: array):
+        self.literals: array = literals
+        self.num_clauses: int = len(literals) // 3
+
+        # variable ids from the input are renumbered 1..num_vars, so memory only depends on
+        # how many variables occur; variables[v - 1] is the input id of the internal variable v
+        self.variables: List[int] = sorted({abs(l) for l in literals})
+        self.num_vars: int = len(self.variables)
+        index: Dict[int, int] = {var_id: v for v, var_id in enumerate(self.variables, start=1)}
+        self.dense: array = array('i', (index[l] if l > 0 else -index[-l] for l in literals))
+
+        # occ[2v] lists the clauses containing v, occ[2v + 1] the clauses containing -v
+        self.occ: List[List[int]] = self._build_occurrences()
+
+        # branching order: most constrained variables first
+        counts = [len(self.occ[2 * v]) + len(self.occ[2 * v + 1]) for v in range(self.num_vars + 1)]
+        self.order: List[int] = sorted(range(1, self.num_vars + 1), key=lambda v: -counts[v])
+
+        # value[v] is 1 (TRUE), -1 (FALSE) or 0 (unassigned)
+        self.value: List[int] = [0] * (self.num_vars + 1)
+        self.trail: List[int] = []
+        self.queue_head: int = 0
+
+        # search statistics
+        self.decisions: int = 0
+        self.propagations: int = 0
+        self.conflicts: int = 0
+        self.backtracks: int = 0
+        self.max_depth_reached: int = 0
+        self.solve_started_at: float = 0.0
+        self.solve_ended_at: float = 0.0
+
+    def solve(self) -> Optional[Dict[int, bool]]:
+        # reset state and stats for a fresh run
+        self.solve_started_at = time.perf_counter()
+        self.value = [0] * (self.num_vars + 1)
+        self.trail = []
+        self.queue_head = 0
+        self.decisions = 0
+        self.propagations = 0
+        self.conflicts = 0
+        self.backtracks = 0
+        self.max_depth_reached = 0
+
+        # decision stack entries: (trail length before the decision, order position, variable, flipped)
+        stack: List[Tuple[int, int, int, bool]] = []
+        pos = 0
+
+        while True:
+            if not self._propagate():
+                self.conflicts += 1
+                # undo decisions until one can still be flipped
+                while stack:
+                    trail_len, pos, var, flipped = stack.pop()
+                    self._undo(trail_len)
+                    if not flipped:
+                        stack.append((trail_len, pos, var, True))
+                        self._set(var)
+                        break
+                    self.backtracks += 1
+                else:
+                    self.backtracks += 1
+                    self.solve_ended_at = time.perf_counter()
+                    return None
+                continue
+
+            # next unassigned variable (everything before pos is assigned on this branch)
+            while pos < len(self.order) and self.value[self.order[pos]] != 0:
+                pos += 1
+            if pos == len(self.order):
+                self.solve_ended_at = time.perf_counter()
+                return {var_id: self.value[v] > 0 for v, var_id in enumerate(self.variables, start=1)}
+
+            var = self.order[pos]
+            self.decisions += 1
+            stack.append((len(self.trail), pos, var, False))
+            if len(stack) > self.max_depth_reached:
+                self.max_depth_reached = len(stack)
+            # most literals are FALSE in a 1-in-3 solution, so try that first
+            self._set(-var)
+
+    def is_solution(self, assignment: Dict[int, bool]) -> bool:
+        # exactly one TRUE literal per clause, unassigned variables count as FALSE
+        lits = self.literals
+        for base in range(0, len(lits), 3):
+            trues = 0
+            for l in lits[base:base + 3]:
+                if assignment.get(abs(l), False) == (l > 0):
+                    trues += 1
+            if trues != 1:
+                return False
+        return True
+
+    def _build_occurrences(self) -> List[List[int]]:
+        occ: List[List[int]] = [[] for _ in range(2 * (self.num_vars + 1))]
+        for i, l in enumerate(self.dense):
+            occ[2 * l if l > 0 else -2 * l + 1].append(i // 3)
+        return occ
+
+    def _set(self, lit: int) -> bool:
+        # make lit TRUE, returns False if it is already FALSE
+        var = lit if lit > 0 else -lit
+        want = 1 if lit > 0 else -1
+        current = self.value[var]
+        if current == 0:
+            self.value[var] = want
+            self.trail.append(var)
+            self.propagations += 1
+            return True
+        return current == want
+
+    def _undo(self, trail_len: int) -> None:
+        value = self.value
+        for var in self.trail[trail_len:]:
+            value[var] = 0
+        del self.trail[trail_len:]
+        self.queue_head = trail_len
+
+    def _propagate(self) -> bool:
+        lits = self.dense
+        value = self.value
+        occ = self.occ
+        trail = self.trail
+
+        while self.queue_head < len(trail):
+            var = trail[self.queue_head]
+            self.queue_head += 1
+            true_lit = var if value[var] > 0 else -var
+            true_idx = 2 * var if true_lit > 0 else 2 * var + 1
+            false_idx = true_idx ^ 1
+
+            # clauses where a literal just became TRUE: the other two slots must be FALSE
+            for c in occ[true_idx]:
+                base = 3 * c
+                skipped = False
+                for j in range(base, base + 3):
+                    m = lits[j]
+                    if m == true_lit and not skipped:
+                        skipped = True
+                        continue
+                    if not self._set(-m):
+                        return False
+
+            # clauses where a literal just became FALSE: conflict or a forced TRUE literal
+            for c in occ[false_idx]:
+                base = 3 * c
+                free = 0
+                last_free = 0
+                satisfied = False
+                for j in range(base, base + 3):
+                    m = lits[j]
+                    v = value[m if m > 0 else -m]
+                    if v == 0:
+                        free += 1
+                        last_free = m
+                    elif (v > 0) == (m > 0):
+                        satisfied = True
+                        break
+                if satisfied:
+                    continue
+                if free == 0:
+                    return False
+                if free == 1 and not self._set(last_free):
+                    return False
+
+        return True
+
+    def print_stats(self) -> None:
+        GREEN = "\033[92m"
+        YELLOW = "\033[93m"
+        CYAN = "\033[96m"
+        RED = "\033[91m"
+        BOLD = "\033[1m"
+        RESET = "\033[0m"
+
+        print()
+        print(f"{BOLD}{CYAN}Search statistics:{RESET}")
+        print(f"📦 Variables / clauses: {YELLOW}{len(self.variables)} / {self.num_clauses}{RESET}")
+        print(f"🧭 Decisions: {GREEN}{self.decisions}{RESET}")
+        print(f"🔗 Propagated assignments: {GREEN}{self.propagations}{RESET}")
+        print(f"💥 Conflicts: {RED}{self.conflicts}{RESET}")
+        print(f"↩️  Backtracks: {RED}{self.backtracks}{RESET}")
+        print(f"📏 Max depth reached: {GREEN}{self.max_depth_reached}{RESET}")
+        elapsed_s = max(0.0, self.solve_ended_at - self.solve_started_at)
+        print(f"⏱  Time: {YELLOW}{elapsed_s*1000:.2f} ms{RESET}")
@@ -1,3 +1,5 @@
+from array import array
+
 from lib.Clause import Clause
 
 class Reader:
@@ -83,4 +85,69 @@ class OITReader(Reader):
             clauses.append(Clause(literals))
 
         # return the results
-        return clauses
\ No newline at end of file
+        return clauses
+
+class OITStreamReader(Reader):
+    # literals are stored in an array('i'), i.e. 32-bit signed ints
+    MAX_VARIABLE = 2**31 - 1
+
+    def __init__(self, chunk_size: int = 1 << 16):
+        super()
+        self.chunk_size = chunk_size
+
+    def read_from_file(self, file_path):
+        with open(file_path, 'r', encoding='utf-8') as file:
+            return self._parse(file)
+
+    def read_from_stdin(self):
+        import sys
+        return self._parse(sys.stdin)
+
+    def _parse(self, stream) -> array:
+        # clauses are stored flat: clause c occupies literals[3c], literals[3c+1], literals[3c+2]
+        literals = array('i')
+        carry = ''
+        while True:
+            chunk = stream.read(self.chunk_size)
+            if not chunk:
+                break
+
+            # everything before the last '#' is made of complete clauses,
+            # the tail may be cut in the middle of a clause and waits for the next chunk
+            parts = (carry + chunk).split('#')
+            carry = parts.pop()
+            for part in parts:
+                self._append_clause(literals, part)
+
+        self._append_clause(literals, carry)
+        if not literals:
+            raise ValueError("Input contains no clauses")
+        return literals
+
+    def _append_clause(self, literals: array, part: str):
+        part = part.strip()
+        if not part:  # skip empty clauses (e.g. trailing '#')
+            return
+
+        ls = part.split(',')
+        if len(ls) != 3:
+            raise ValueError(f"Clause must have exactly 3 literals, got {len(ls)}: {part}")
+
+        a, b, c = int(ls[0]), int(ls[1]), int(ls[2])
+        if a == 0 or b == 0 or c == 0:
+            raise ValueError(f"Literal 0 is not a valid variable: {part}")
+        if max(abs(a), abs(b), abs(c)) > self.MAX_VARIABLE:
+            raise ValueError(f"Variable ids must be at most {self.MAX_VARIABLE}: {part}")
+        literals.extend((a, b, c))
+
+    @staticmethod
+    def to_clauses(literals: array) -> list[Clause]:
+        # expand the flat array into Clause objects, e.g. to go through Translator.to_swe
+        clauses = []
+        for i in range(0, len(literals), 3):
+            clause = literals[i:i + 3]
+            # Clause stores one entry per variable, so repeats cannot be represented
+            if len({abs(l) for l in clause}) != 3:
+                raise ValueError(f"SWE reduction requires 3 distinct variables per clause: {','.join(map(str, clause))}")
+            clauses.append(Clause({abs(l): l > 0 for l in clause}))
+        return clauses
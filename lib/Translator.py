@@ -34,6 +34,9 @@ class Translator:
         
         # Sort variables for consistent ordering
         sorted_variables = sorted(all_variables)
+        # two letters per variable, and the solver only knows the 26 letters A-Z
+        if len(sorted_variables) > 13:
+            raise ValueError(f"SWE reduction supports at most 13 variables, got {len(sorted_variables)}")
         self.sorted_variables = sorted_variables
         
         # Create mapping from variable ID to letter pairs
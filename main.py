@@ -1,18 +1,101 @@
-from lib.Reader import SWEReader
+import sys
+
+from lib.Reader import SWEReader, OITStreamReader
 from lib.Problem import Problem
 from lib.Solver import Solver
+from lib.OITSolver import OITSolver
+from lib.Translator import Translator
+
+# usage:
+#   python main.py               SWE instance from stdin, solved with the SWE solver
+#   python main.py --oit         1-in-3-SAT instance from stdin, solved natively with exactly-one propagation
+#   python main.py --oit-swe     1-in-3-SAT instance from stdin, reduced to SWE and solved with the SWE solver
+#   python main.py --oit-check   1-in-3-SAT instance from stdin, solved both ways and checked against each other
+# the --oit modes accept --stats as a second argument to print each solver's search statistics and timing
+mode = sys.argv[1] if len(sys.argv) > 1 else '--swe'
+show_stats = '--stats' in sys.argv[2:]
+
+
+def fail(message):
+    print(message, file=sys.stderr)
+    sys.exit(1)
+
+
+def solve_oit_native(literals):
+    solver = OITSolver(literals)
+    solution = solver.solve()
+    if show_stats:
+        print("native route:", end='')
+        solver.print_stats()
+    return solution
+
+
+def solve_oit_swe(literals):
+    # at most 13 variables and 3 distinct variables per clause: ValueError otherwise
+    translator = Translator()
+    problem = Problem(translator.to_swe(OITStreamReader.to_clauses(literals)))
+    problem.preprocess(verbose=False)
+
+    solver = Solver(problem.s, problem.t, problem.R)
+    solution = solver.solve()
+    if show_stats:
+        print("SWE route:", end='')
+        solver.print_stats()
+    return None if solution is None else translator.from_swe(solution)
+
+
+def print_oit_solution(oit_solution):
+    if oit_solution is None:
+        print("NO")
+    else:
+        for var_id in sorted(oit_solution.keys()):
+            print(f"{var_id}:{1 if oit_solution[var_id] else 0}")
+
+
+def describe(checker, oit_solution):
+    # returns (text, satisfiable, valid)
+    if oit_solution is None:
+        return "NO", False, True
+    if checker.is_solution(oit_solution):
+        return "YES (valid assignment)", True, True
+    return "YES (INVALID assignment)", True, False
+
+
+if mode == '--swe':
+    reader = SWEReader()
+    swe_problem_data = reader.read_from_stdin()
+
+    problem = Problem(swe_problem_data)
+    problem.preprocess(verbose=False)
+
+    solver = Solver(problem.s, problem.t, problem.R)
+    solution = solver.solve()
 
-reader = SWEReader()
-swe_problem_data = reader.read_from_stdin()
+    if solution is None:
+        print("NO")
+    else:
+        for letter in sorted(solution.assignment.keys()):
+            print(f"{letter}:{solution.assignment[letter]}")
 
-problem = Problem(swe_problem_data)
-problem.preprocess(verbose=False)
+elif mode in ('--oit', '--oit-swe', '--oit-check'):
+    try:
+        literals = OITStreamReader().read_from_stdin()
 
-solver = Solver(problem.s, problem.t, problem.R)
-solution = solver.solve()
+        if mode == '--oit':
+            print_oit_solution(solve_oit_native(literals))
+        elif mode == '--oit-swe':
+            print_oit_solution(solve_oit_swe(literals))
+        else:
+            checker = OITSolver(literals)
+            native, native_sat, native_ok = describe(checker, solve_oit_native(literals))
+            swe, swe_sat, swe_ok = describe(checker, solve_oit_swe(literals))
+            print(f"native: {native}")
+            print(f"swe:    {swe}")
+            if not (native_ok and swe_ok and native_sat == swe_sat):
+                fail("MISMATCH")
+            print("OK")
+    except ValueError as e:
+        fail(f"error: {e}")
 
-if solution is None:
-    print("NO")
 else:
-    for letter in sorted(solution.assignment.keys()):
-        print(f"{letter}:{solution.assignment[letter]}")
\ No newline at end of file
+    fail(f"unknown mode {mode}, expected one of --swe, --oit, --oit-swe, --oit-check")